@@ -10,10 +10,29 @@ from .models import (
     Alert
 )
 
-admin.site.register(Alert)
+
+@admin.register(Alert)
+class AlertAdmin(admin.ModelAdmin):
+    list_display = ('id', 'title', 'status', 'timestamp', 'customer', 'endpoint')
+    list_select_related = ('customer', 'endpoint')
+    raw_id_fields = ('endpoint', 'customer', 'source', 'validator', 'resolver', 'mitigation_strategy')
+    list_filter = ('status', 'closure_code', 'severity')
+    search_fields = ('title',)
+
+
+@admin.register(Endpoint)
+class EndpointAdmin(admin.ModelAdmin):
+    list_display = ('name', 'ip', 'customer', 'is_active')
+    list_select_related = ('customer',)
+
+
+@admin.register(UserProfile)
+class UserProfileAdmin(admin.ModelAdmin):
+    list_display = ('user', 'customer', 'is_analyst')
+    list_select_related = ('user', 'customer')
+
+
 admin.site.register(Customer)
-admin.site.register(Endpoint)
-admin.site.register(UserProfile)
 admin.site.register(Source)
 admin.site.register(Rule)
 admin.site.register(MitigationStrategy)
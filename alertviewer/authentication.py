@@ -0,0 +1,36 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt import authentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+class JWTAuthentication(authentication.JWTAuthentication):
+    """
+    JWT authentication that loads the user's profile and customer in the same query,
+    so permission checks and customer-scoped querysets do not fetch them again.
+    """
+
+    def get_user(self, validated_token):
+        # Mirrors JWTAuthentication.get_user from djangorestframework-simplejwt 5.3.1 (pinned in
+        # requirements.txt), only the user lookup adds select_related. Re-sync it when upgrading.
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        try:
+            user = self.user_model.objects.select_related('profile', 'profile__customer').get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
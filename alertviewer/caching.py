@@ -0,0 +1,35 @@
+from django.core.cache import cache
+
+DASHBOARD_CACHE_TIMEOUT = 60
+
+
+def _dashboard_version_key(customer_id):
+    return f'alert_dash_ver:{customer_id}'
+
+
+def dashboard_cache_key(customer_id, after, before):
+    """
+    Key for a customer's dashboard statistics over a window.
+    The per-customer version in the key lets invalidate_dashboard_cache() drop every window at once.
+    """
+    version = cache.get_or_set(_dashboard_version_key(customer_id), 1, None)
+    return f'alert_dash:{customer_id}:{version}:{after}:{before}'
+
+
+def invalidate_dashboard_cache(customer_id):
+    try:
+        cache.incr(_dashboard_version_key(customer_id))
+    except ValueError:
+        cache.set(_dashboard_version_key(customer_id), 1, None)
+
+
+def endpoint_dashboard_cache_key(customer_id):
+    return f'endpoint_dash:{customer_id}'
+
+
+def endpoint_rows_cache_key(customer_id):
+    return f'endpoint_rows:{customer_id}'
+
+
+def invalidate_endpoint_caches(customer_id):
+    cache.delete_many([endpoint_dashboard_cache_key(customer_id), endpoint_rows_cache_key(customer_id)])
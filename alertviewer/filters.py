@@ -1,12 +1,12 @@
 import django_filters
 
-from .models import Alert, Source
+from .models import Alert
 
 
 class AlertFilter(django_filters.FilterSet):
-    status = django_filters.ChoiceFilter(choices=Alert.STATUS_CHOICES)
-    closure_code = django_filters.ChoiceFilter(choices=Alert.CLOSURE_CODE_CHOICES)
-    source = django_filters.ModelChoiceFilter(queryset=Source.objects.all())
+    status = django_filters.ChoiceFilter(choices=Alert.Status.choices)
+    closure_code = django_filters.ChoiceFilter(choices=Alert.ClosureCode.choices)
+    source = django_filters.NumberFilter(field_name='source_id')
     timestamp_before = django_filters.DateTimeFilter(field_name="timestamp", lookup_expr='lte')
     timestamp_after = django_filters.DateTimeFilter(field_name="timestamp", lookup_expr='gte')
 
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alertviewer', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alert',
+            name='severity',
+            field=models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], default='low', max_length=10),
+        ),
+        migrations.AddField(
+            model_name='source',
+            name='description',
+            field=models.TextField(default=''),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='alert',
+            name='closure_code',
+            field=models.CharField(choices=[('NA', 'N/A'), ('TP', 'True Positive'), ('FP', 'False Positive'), ('TPNM', 'True Positive Not Malicious')], default='NA', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='alert',
+            name='mitigation',
+            field=models.CharField(choices=[('NA', 'N/A'), ('soc', 'By SOC Team'), ('customer', 'By Customer')], default='NA', max_length=50),
+        ),
+        migrations.AlterField(
+            model_name='alert',
+            name='resolver',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='resolved_alerts', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='alert',
+            name='validator',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='validated_alerts', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='customer',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='alertviewer.customer'),
+        ),
+        migrations.AlterField(
+            model_name='userprofile',
+            name='user',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profile', to=settings.AUTH_USER_MODEL),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alertviewer', '0002_sync_with_models'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['status'], name='alertviewer_status_d12e06_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['closure_code'], name='alertviewer_closure_48dcc9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['-timestamp'], name='alertviewer_timesta_5c1710_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['customer', '-timestamp'], name='alertviewer_custome_122c17_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['source', '-timestamp'], name='alertviewer_source__5734a6_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alertviewer', '0003_alert_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='alert',
+            name='closure_code',
+            field=models.CharField(choices=[('NA', 'N/A'), ('TP', 'True Positive'), ('FP', 'False Positive'), ('TPNM', 'True Positive Not Malicious')], default='NA', max_length=4),
+        ),
+        migrations.AlterField(
+            model_name='alert',
+            name='mitigation',
+            field=models.CharField(choices=[('NA', 'N/A'), ('soc', 'By SOC Team'), ('customer', 'By Customer')], default='NA', max_length=8),
+        ),
+        migrations.AlterField(
+            model_name='alert',
+            name='status',
+            field=models.CharField(choices=[('open', 'Open'), ('validated', 'Validated'), ('resolved', 'Resolved')], default='open', max_length=10),
+        ),
+    ]
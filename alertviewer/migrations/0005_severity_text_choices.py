@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alertviewer', '0004_narrow_alert_choice_columns'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='alert',
+            name='severity',
+            field=models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], default='low', max_length=6),
+        ),
+    ]
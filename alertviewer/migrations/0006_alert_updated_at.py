@@ -0,0 +1,28 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alertviewer', '0005_severity_text_choices'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alert',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['updated_at'], name='alertviewer_updated_fa7476_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['customer', 'updated_at'], name='alertviewer_custome_021328_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:25
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def merge_duplicate_strategies(apps, schema_editor):
+    """
+    Point alerts at the oldest strategy with each description and delete the duplicates,
+    so the unique constraint can be added.
+    """
+    MitigationStrategy = apps.get_model('alertviewer', 'MitigationStrategy')
+    Alert = apps.get_model('alertviewer', 'Alert')
+
+    kept = {}
+    for pk, description in MitigationStrategy.objects.order_by('pk').values_list('pk', 'description').iterator():
+        kept_pk = kept.setdefault(description, pk)
+        if kept_pk != pk:
+            Alert.objects.filter(mitigation_strategy_id=pk).update(mitigation_strategy_id=kept_pk,
+                                                                   updated_at=timezone.now())
+            MitigationStrategy.objects.filter(pk=pk).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alertviewer', '0006_alert_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_strategies, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='mitigationstrategy',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.MD5('description'), name='mitigation_desc_md5_uniq'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alertviewer', '0007_mitigation_strategy_description_md5'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RenameIndex(
+            model_name='alert',
+            new_name='alert_cust_ts_idx',
+            old_name='alertviewer_custome_122c17_idx',
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(condition=models.Q(('closure_code', 'TPNM')), fields=['customer', '-timestamp'], name='alert_tpnm_cust_ts_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:25
+
+import django.db.models.functions.datetime
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alertviewer', '0008_name_customer_timestamp_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='alert',
+            name='timestamp_day',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.datetime.TruncDate('timestamp'), output_field=models.DateField()),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['customer', 'timestamp_day'], name='alertviewer_custome_45a56c_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.4 on 2026-10-15 22:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alertviewer', '0009_alert_timestamp_day'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='alert',
+            name='alertviewer_timesta_5c1710_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='alert',
+            name='alert_cust_ts_idx',
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['-timestamp', '-id'], name='alertviewer_timesta_b5dcab_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alert',
+            index=models.Index(fields=['customer', '-timestamp', '-id'], name='alert_cust_ts_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import MD5, TruncDate
 from django.contrib.auth.models import User
 
 
@@ -51,49 +52,74 @@ class Rule(models.Model):
 class MitigationStrategy(models.Model):
     description = models.TextField()
 
+    class Meta:
+        constraints = [
+            # Unique on a hash, a B-tree index on the unbounded text itself rejects long descriptions
+            models.UniqueConstraint(MD5('description'), name='mitigation_desc_md5_uniq'),
+        ]
+
     def __str__(self):
         return self.description[:50]
 
 
 class Alert(models.Model):
-    STATUS_CHOICES = [
-        ('open', 'Open'),
-        ('validated', 'Validated'),
-        ('resolved', 'Resolved'),
-    ]
-    CLOSURE_CODE_CHOICES = [
-        ('NA', 'N/A'),
-        ('TP', 'True Positive'),
-        ('FP', 'False Positive'),
-        ('TPNM', 'True Positive Not Malicious'),
-    ]
-    MITIGATION_CHOICES = [
-        ('NA', 'N/A'),
-        ("soc", 'By SOC Team'),
-        ("customer", 'By Customer'),
-    ]
-    SEVERITY_CHOICES = [
-        ('low', 'Low'),
-        ('medium', 'Medium'),
-        ('high', 'High'),
-    ]
+    class Status(models.TextChoices):
+        OPEN = 'open', 'Open'
+        VALIDATED = 'validated', 'Validated'
+        RESOLVED = 'resolved', 'Resolved'
+
+    class ClosureCode(models.TextChoices):
+        NA = 'NA', 'N/A'
+        TP = 'TP', 'True Positive'
+        FP = 'FP', 'False Positive'
+        TPNM = 'TPNM', 'True Positive Not Malicious'
+
+    class Mitigation(models.TextChoices):
+        NA = 'NA', 'N/A'
+        SOC = 'soc', 'By SOC Team'
+        CUSTOMER = 'customer', 'By Customer'
+
+    class Severity(models.TextChoices):
+        LOW = 'low', 'Low'
+        MEDIUM = 'medium', 'Medium'
+        HIGH = 'high', 'High'
 
     title = models.CharField(max_length=255)
     description = models.TextField()
     timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp_day = models.GeneratedField(
+        expression=TruncDate('timestamp'),
+        output_field=models.DateField(),
+        db_persist=True,
+    )
+    updated_at = models.DateTimeField(auto_now=True)
     endpoint = models.ForeignKey(Endpoint, on_delete=models.CASCADE)
     source = models.ForeignKey(Source, on_delete=models.CASCADE)
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE)
     validator = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='validated_alerts')
     validated_at = models.DateTimeField(null=True, blank=True)
-    status = models.CharField(max_length=50, choices=STATUS_CHOICES, default='open')
-    closure_code = models.CharField(max_length=50, choices=CLOSURE_CODE_CHOICES, default='NA')
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.OPEN)
+    closure_code = models.CharField(max_length=4, choices=ClosureCode.choices, default=ClosureCode.NA)
     mitigation_strategy = models.ForeignKey(MitigationStrategy, on_delete=models.SET_NULL, null=True, blank=True)
-    mitigation = models.CharField(max_length=50, choices=MITIGATION_CHOICES, default='NA')
+    mitigation = models.CharField(max_length=8, choices=Mitigation.choices, default=Mitigation.NA)
     resolved_at = models.DateTimeField(null=True, blank=True)
     resolver = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='resolved_alerts')
     rules = models.ManyToManyField(Rule, related_name='alerts')
-    severity = models.CharField(max_length=10, choices=SEVERITY_CHOICES, default='low')
+    severity = models.CharField(max_length=6, choices=Severity.choices, default=Severity.LOW)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status']),
+            models.Index(fields=['closure_code']),
+            models.Index(fields=['-timestamp', '-id']),
+            models.Index(fields=['customer', '-timestamp', '-id'], name='alert_cust_ts_idx'),
+            models.Index(fields=['customer', '-timestamp'], name='alert_tpnm_cust_ts_idx',
+                         condition=models.Q(closure_code='TPNM')),
+            models.Index(fields=['source', '-timestamp']),
+            models.Index(fields=['customer', 'timestamp_day']),
+            models.Index(fields=['updated_at']),
+            models.Index(fields=['customer', 'updated_at']),
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,11 @@
+from rest_framework.pagination import CursorPagination
+
+
+class AlertCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the newest alerts first; deep pages cost the same as the first one.
+    The id tiebreaker keeps the order stable for alerts sharing a timestamp.
+    """
+    ordering = ('-timestamp', '-id')
+    page_size_query_param = 'page_size'
+    max_page_size = 100
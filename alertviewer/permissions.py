@@ -5,13 +5,14 @@ from trench.models import MFAMethod
 class IsCustomer(BasePermission):
 
     def has_permission(self, request, view):
-        return hasattr(request.user, 'profile') and bool(request.user.profile.customer)
+        profile = getattr(request.user, 'profile', None)
+        return profile is not None and profile.customer_id is not None
 
 
 class IsAnalyst(BasePermission):
 
     def has_permission(self, request, view):
-        return hasattr(request.user, 'profile') and request.user.profile.is_analyst
+        return is_analyst(request)
 
 
 class IsEndpoint(BasePermission):
@@ -33,11 +34,10 @@ class IsAuthenticatedWithMFA(BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
 
-        mfa_methods = MFAMethod.objects.filter(user=request.user, is_active=True)
-        if not mfa_methods.exists():
-            return False
-
-        return True
+        # Not cached across requests: trench activates and deactivates methods with QuerySet.update(),
+        # which sends no signal, and a stale answer here would let a user through without MFA
+        return MFAMethod.objects.filter(user=request.user, is_active=True).exists()
 
 def is_analyst(request):
-    return hasattr(request.user, 'profile') and request.user.profile.is_analyst
+    profile = getattr(request.user, 'profile', None)
+    return profile is not None and profile.is_analyst
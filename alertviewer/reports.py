@@ -0,0 +1,248 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.shapes import Drawing
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer, PageBreak
+
+REPORT_RENDER_WORKERS = min(4, os.cpu_count() or 1)
+# Seconds a request waits for its report, so a wedged worker cannot hold the request thread forever
+REPORT_RENDER_TIMEOUT = 60
+LONG_TABLE_CHUNK_SIZE = 500
+
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+_STYLES = getSampleStyleSheet()
+
+_TABLE_STYLE = TableStyle([('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                           ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                           ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+                           ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                           ('BOTTOMPADDING', (0, 0), (-1, 0), 12)])
+
+_BAR_PALETTES = {
+    'severity': (colors.coral, colors.yellow, colors.aquamarine),
+    'event': (colors.cyan, colors.aliceblue, colors.aqua, colors.aquamarine, colors.azure, colors.beige),
+    'source': (colors.limegreen,),
+}
+_PIE_PALETTE = (colors.red, colors.yellow, colors.blue)
+
+
+def render_report(report, output):
+    """
+    Render the customer PDF report into the binary file-like `output`.
+    Takes only plain, picklable data (see PDFReportView.get_report_data), so it can run outside the request.
+    """
+    doc = SimpleDocTemplate(output, pagesize=A4)
+    doc.build(list(_build_story(report)), onFirstPage=add_page_number, onLaterPages=add_page_number)
+
+
+def render_report_in_worker(report, path):
+    """
+    Render the report into the file at `path` in a worker process, so the CPU-bound build is off the request thread.
+    The worker writes the file itself; the PDF bytes never travel back to the request process.
+    """
+    pool = _get_render_pool()
+    try:
+        _render_in_pool(pool, report, path)
+    except BrokenProcessPool:
+        # A worker that dies (OOM kill, segfault) breaks the executor for good, so replace it and retry once
+        _discard_render_pool(pool)
+        _render_in_pool(_get_render_pool(), report, path)
+
+
+def _render_in_pool(pool, report, path):
+    pool.submit(_render_report_file, report, os.fspath(path)).result(timeout=REPORT_RENDER_TIMEOUT)
+
+
+def _get_render_pool():
+    # Created on first use so management commands never start workers. Spawned, not forked,
+    # because the server process is multi-threaded.
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ProcessPoolExecutor(max_workers=REPORT_RENDER_WORKERS,
+                                               mp_context=multiprocessing.get_context('spawn'))
+        return _render_pool
+
+
+def _discard_render_pool(pool):
+    global _render_pool
+    with _render_pool_lock:
+        # A concurrent request may already have replaced it
+        if _render_pool is pool:
+            _render_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _render_report_file(report, path):
+    with open(path, 'wb') as output:
+        render_report(report, output)
+
+
+def _build_story(report):
+    """
+    Yield the report's flowables in page order.
+    """
+    company_name = report['company_name']
+    after_date = report['after_date']
+    before_date = report['before_date']
+    severity_data = report['severity_data']
+    event_data = report['event_data']
+    status_data = report['status_data']
+    source_data = report['source_data']
+    endpoint_rows = report['endpoint_rows']
+
+    severity_chart_data = list(severity_data)
+    severity_order_fixer = severity_chart_data.pop(1)
+    severity_chart_data.append(severity_order_fixer)
+    severities, severity_counts = _columns(severity_chart_data)
+    dates, event_counts = _columns(event_data)
+    statuses, status_counts = _columns(status_data)
+    sources, source_counts = _columns(source_data)
+
+    # Title
+    yield Paragraph(f"Report for {company_name}", _STYLES['Title'])
+    yield Spacer(1, 12)
+    yield Paragraph(f"Data provided in this document is gathered "
+                    f"between {after_date.strftime("%Y-%m-%d")} and "
+                    f"{before_date.strftime("%Y-%m-%d")}",
+                    _STYLES['Normal'])
+
+    # --- Block 1: Alerts Summary (Table and Chart) ---
+    yield Paragraph("Alerts Summary", _STYLES['Heading2'])
+    yield _table(["Severity", "Count"], severity_data)
+    yield Spacer(1, 12)
+
+    # Severity Bar Chart
+    yield _bar_chart(severity_counts, severities, 'severity')
+    yield Spacer(1, 24)
+
+    # --- Block 2: Event Counts (Table and Chart) ---
+    yield Paragraph("Event Counts by Date", _STYLES['Heading2'])
+    yield _table(["Date", "Event Count"], zip(dates, event_counts))
+    yield Spacer(1, 12)
+
+    # Event Counts Line Chart
+    yield _bar_chart(event_counts, dates, 'event')
+    yield Spacer(1, 24)
+
+    # --- Block 3: Alert Status (Table and Chart) ---
+    yield Paragraph("Alert Status Distribution", _STYLES['Heading2'])
+    yield _table(["Status", "Count"], status_data)
+    yield Spacer(1, 12)
+
+    # Alert Status Pie Chart
+    yield _pie_chart(status_counts, statuses)
+    yield Spacer(1, 24)
+
+    # --- Block 4: Sources (Table and Chart) ---
+    yield Paragraph("Alert Sources", _STYLES['Heading2'])
+    yield _table(["Source", "Count"], source_data)
+    yield Spacer(1, 12)
+
+    # Sources Bar Chart
+    yield _bar_chart(source_counts, sources, 'source')
+    yield PageBreak()
+
+    # --- Block 5: Endpoint Status Table ---
+    yield Paragraph("Endpoint Status", _STYLES['Heading2'])
+    yield from _long_tables(["Endpoint", "Is Active"], endpoint_rows)
+
+
+def _table(header, rows):
+    """
+    Left-aligned table in the report's style, with a header row.
+    """
+    return Table([header, *map(list, rows)], hAlign='LEFT', style=_TABLE_STYLE)
+
+
+def _long_tables(header, rows, chunk_size=LONG_TABLE_CHUNK_SIZE):
+    """
+    Like _table(), for tables that can run over several pages: single-pass layout, header repeated per page.
+    Split every `chunk_size` rows, since table layout and splitting cost grows faster than the row count.
+    """
+    for start in range(0, max(len(rows), 1), chunk_size):
+        if start:
+            yield Spacer(1, 12)
+        yield LongTable([header, *map(list, rows[start:start + chunk_size])],
+                        hAlign='LEFT', style=_TABLE_STYLE, repeatRows=1)
+
+
+def _bar_chart(values, categories, palette):
+    """
+    Single-series bar chart of counts, sized like every chart in the report.
+    """
+    return _chart_drawing(_bar_chart_shapes(values, categories, palette))
+
+
+@lru_cache(maxsize=256)
+def _bar_chart_shapes(values, categories, palette):
+    # Cached per process: the chart is laid out into plain shapes once, and identical data reuses them.
+    # Only the shapes are shared, platypus keeps per-document layout state on the Drawing flowable.
+    chart = VerticalBarChart()
+    chart.x = 50
+    chart.y = 50
+    chart.width = 300
+    chart.height = 125
+    chart.data = [list(values)]
+    chart.categoryAxis.categoryNames = list(categories)
+    chart.valueAxis.valueMin = 0
+    palette_colors = _BAR_PALETTES[palette]
+    for i in range(len(chart.bars)):
+        chart.bars[i].fillColor = palette_colors[i % len(palette_colors)]
+    return chart.draw()
+
+
+def _pie_chart(values, labels):
+    """
+    Pie chart of counts, shapes cached like _bar_chart().
+    """
+    return _chart_drawing(_pie_chart_shapes(values, labels))
+
+
+@lru_cache(maxsize=256)
+def _pie_chart_shapes(values, labels):
+    pie = Pie()
+    pie.x = 50
+    pie.y = 50
+    pie.width = 180
+    pie.height = 120
+    pie.data = list(values)
+    pie.labels = list(labels)
+    for i, color in enumerate(_PIE_PALETTE):
+        pie.slices[i].fillColor = color
+    return pie.draw()
+
+
+def _chart_drawing(shapes):
+    drawing = Drawing(370, 180)
+    drawing.add(shapes)
+    return drawing
+
+
+def _columns(rows):
+    """
+    Split (label, count) rows into a labels tuple and a counts tuple in a single pass.
+    """
+    if not rows:
+        return (), ()
+    labels, counts = zip(*rows)
+    return labels, counts
+
+
+def add_page_number(canvas, doc):
+    # Every page starts with a black fill, so only the font is set, inside its own graphics state
+    canvas.saveState()
+    canvas.setFont('Helvetica', 10)
+    canvas.drawString(500, 20, f"Page {doc.page}")
+    canvas.restoreState()
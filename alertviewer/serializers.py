@@ -1,5 +1,17 @@
-from django.shortcuts import get_object_or_404
+from collections import defaultdict
+from datetime import timedelta
+from functools import cached_property
+from zlib import crc32
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils.timezone import now
 from rest_framework import serializers
+from rest_framework.exceptions import NotFound
+from rest_framework.relations import PrimaryKeyRelatedField, SlugRelatedField
+from rest_framework.utils import model_meta
+from .caching import invalidate_dashboard_cache
 from .models import (
     Customer,
     Endpoint,
@@ -10,6 +22,98 @@ from .models import (
     Alert
 )
 
+ALERT_REPRESENTATION_CACHE_TIMEOUT = 300
+
+
+def get_eager_loads(serializer, prefix=''):
+    """
+    Walk the readable fields of a ModelSerializer and return the (select_related, prefetch_related)
+    lookups needed to render them without a query per row.
+    Primary key relations are skipped, they render straight from the `<name>_id` column,
+    and to-many slug relations prefetch only the slug column.
+    """
+    select_related, prefetch_related = [], []
+    serializer = getattr(serializer, 'child', serializer)
+
+    for field in serializer.fields.values():
+        if field.write_only or isinstance(field, PrimaryKeyRelatedField):
+            continue
+
+        model, path, to_many = serializer.Meta.model, [], False
+        for attr in field.source_attrs:
+            info = model_meta.get_field_info(model)
+            relation = info.forward_relations.get(attr) or info.reverse_relations.get(attr)
+            if relation is None:
+                break
+            path.append(attr)
+            model = relation.related_model
+            if relation.to_many:
+                to_many = True
+                break
+        if not path:
+            continue
+        lookup = prefix + '__'.join(path)
+
+        nested = getattr(field, 'child', field)
+        if isinstance(nested, serializers.ModelSerializer):
+            nested_select, nested_prefetch = get_eager_loads(nested, prefix=f'{lookup}__')
+        else:
+            nested_select, nested_prefetch = [], []
+
+        child_relation = getattr(field, 'child_relation', None)
+        if to_many and isinstance(child_relation, SlugRelatedField):
+            prefetch_related.append(Prefetch(lookup, queryset=model.objects.only(child_relation.slug_field)))
+        elif to_many:
+            prefetch_related += [lookup, *nested_select, *nested_prefetch]
+        else:
+            select_related += [lookup, *nested_select]
+            prefetch_related += nested_prefetch
+
+    return list(dict.fromkeys(select_related)), list(dict.fromkeys(prefetch_related))
+
+
+def eager_load(queryset, serializer):
+    """
+    Apply the select_related/prefetch_related lookups of get_eager_loads() for the serializer to the queryset.
+    """
+    select_related, prefetch_related = get_eager_loads(serializer)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    return queryset
+
+
+class RepresentationCacheMixin:
+    """
+    Serialize each instance once per top-level serializer.
+    Nested objects shared by many alerts (sources, rules, strategies) reuse the first representation.
+    """
+
+    def to_representation(self, instance):
+        if instance.pk is None:
+            return super().to_representation(instance)
+        cache = self.root.__dict__.setdefault('_representation_cache', {})
+        key = (type(self), instance.pk)
+        if key not in cache:
+            cache[key] = super().to_representation(instance)
+        return cache[key]
+
+
+class DynamicFieldsMixin:
+    """
+    Limit the output to the comma-separated `fields` query parameter, if present.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        requested = request.query_params.get('fields') if request else None
+        if not requested:
+            return fields
+        allowed = set(requested.split(','))
+        return {name: field for name, field in fields.items() if name in allowed}
+
 
 class CustomerSerializer(serializers.ModelSerializer):
     class Meta:
@@ -33,34 +137,88 @@ class UserProfileSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class SourceSerializer(serializers.ModelSerializer):
+class SourceSerializer(RepresentationCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = Source
         fields = '__all__'
 
 
-class RuleSerializer(serializers.ModelSerializer):
+class RuleSerializer(RepresentationCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = Rule
         fields = '__all__'
 
 
-class MitigationStrategySerializer(serializers.ModelSerializer):
+class MitigationStrategySerializer(RepresentationCacheMixin, serializers.ModelSerializer):
     class Meta:
         model = MitigationStrategy
         fields = '__all__'
 
 
-class AlertSerializer(serializers.ModelSerializer):
-    rules = RuleSerializer(many=True, read_only=True)
+class AlertSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    rules = serializers.SlugRelatedField(many=True, read_only=True, slug_field='name')
     source = SourceSerializer(read_only=True)
     mitigation_strategy = MitigationStrategySerializer(read_only=True)
-    customer = serializers.CharField(source='customer.name', read_only=True)
+    customer = serializers.CharField(source='customer.company_name', read_only=True)
     endpoint = serializers.CharField(source='endpoint.name', read_only=True)
 
     class Meta:
         model = Alert
-        fields = '__all__'
+        exclude = ('timestamp_day',)
+
+    @cached_property
+    def fields_signature(self):
+        return crc32(','.join(self.fields).encode())
+
+    def to_representation(self, instance):
+        """
+        Serve the representation from the cache while the alert's updated_at is unchanged.
+        Edits to its rules, source, strategy, customer and endpoint bump updated_at too (see signals.touch_alerts).
+        """
+        if instance.pk is None or instance.updated_at is None:
+            return super().to_representation(instance)
+        key = f'alert:{instance.pk}:{instance.updated_at.timestamp()}:{self.fields_signature}'
+        return cache.get_or_set(
+            key,
+            lambda: super(AlertSerializer, self).to_representation(instance),
+            ALERT_REPRESENTATION_CACHE_TIMEOUT,
+        )
+
+
+class AlertListSerializer(AlertSerializer):
+    """Alert representation for list endpoints, without the unbounded description."""
+    class Meta(AlertSerializer.Meta):
+        exclude = ('description', 'timestamp_day')
+
+
+class AlertBulkCreateSerializer(serializers.ListSerializer):
+    """
+    Create a batch of alerts with one INSERT per table instead of a round trip per alert.
+    """
+    batch_size = 500
+
+    def to_internal_value(self, data):
+        # The endpoints, sources and rules of the whole batch are looked up together, one query per table
+        items = super().to_internal_value(data)
+        errors = self.child.resolve_references(items)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return items
+
+    def create(self, validated_data):
+        alerts = [self.child.build_alert(item) for item in validated_data]
+        alert_rule = Alert.rules.through
+        with transaction.atomic():
+            Alert.objects.bulk_create(alerts, batch_size=self.batch_size)
+            alert_rule.objects.bulk_create(
+                [alert_rule(alert_id=alert.pk, rule_id=rule.pk)
+                 for alert, item in zip(alerts, validated_data) for rule in item['rules']],
+                batch_size=self.batch_size,
+            )
+        # bulk_create does not send post_save
+        for customer_id in {alert.customer_id for alert in alerts}:
+            invalidate_dashboard_cache(customer_id)
+        return alerts
 
 
 class AlertCreateSerializer(serializers.ModelSerializer):
@@ -74,43 +232,92 @@ class AlertCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Alert
         fields = ['title', 'description', 'endpoint_id', 'source_name', 'customer_id', 'rules']
+        list_serializer_class = AlertBulkCreateSerializer
 
     def validate(self, data):
-        # Validate endpoint
-        endpoint = get_object_or_404(Endpoint, id=data['endpoint_id'])
-        if not endpoint.is_active:
-            raise serializers.ValidationError({"endpoint_id": "Endpoint is not active."})
-
-        # Validate source
-        source = get_object_or_404(Source, name=data['source_name'])
-
-        # Validate customer
-        customer = get_object_or_404(Customer, id=data['customer_id'])
-
-        # Validate rules
-        rules = Rule.objects.filter(name__in=data['rules'])
-        if rules.count() != len(data['rules']):
-            raise serializers.ValidationError({"rules": "One or more rules not found."})
-
-        data['endpoint'] = endpoint
-        data['source'] = source
-        data['customer'] = customer
-        data['rules'] = rules
+        # In a batch, AlertBulkCreateSerializer resolves the references of all alerts at once
+        if isinstance(self.parent, AlertBulkCreateSerializer):
+            return data
+        error, = self.resolve_references([data])
+        if error:
+            raise serializers.ValidationError(error)
         return data
 
-    def create(self, validated_data):
-        rules = validated_data.pop('rules')
-        alert = Alert.objects.create(
+    @staticmethod
+    def resolve_references(items):
+        """
+        Check the endpoint, source and rules of each alert with one query per table, and replace the source name
+        and rule names with their instances. Returns an error dict per alert, empty when it is valid.
+        """
+        endpoints = Endpoint.objects.only('id', 'is_active', 'customer_id').in_bulk(
+            {item['endpoint_id'] for item in items})
+        sources = {source.name: source for source in
+                   Source.objects.filter(name__in={item['source_name'] for item in items}).only('id', 'name')}
+        rules = defaultdict(list)
+        for rule in Rule.objects.filter(name__in={name for item in items for name in item['rules']}).only('id', 'name'):
+            rules[rule.name].append(rule)
+
+        errors = []
+        for item in items:
+            # Validate endpoint; its customer_id also proves the customer exists
+            endpoint = endpoints.get(item['endpoint_id'])
+            if endpoint is None:
+                raise NotFound('No Endpoint matches the given query.')
+            if not endpoint.is_active:
+                errors.append({'endpoint_id': ['Endpoint is not active.']})
+                continue
+
+            # Validate customer
+            if endpoint.customer_id != item['customer_id']:
+                errors.append({'customer_id': ['Endpoint does not belong to this customer.']})
+                continue
+
+            # Validate source
+            if item['source_name'] not in sources:
+                raise NotFound('No Source matches the given query.')
+
+            # Validate rules
+            if not rules.keys() >= set(item['rules']):
+                errors.append({'rules': ['One or more rules not found.']})
+                continue
+
+            item['source'] = sources[item['source_name']]
+            item['rules'] = [rule for name in dict.fromkeys(item['rules']) for rule in rules[name]]
+            errors.append({})
+        return errors
+
+    @staticmethod
+    def build_alert(validated_data):
+        return Alert(
             title=validated_data['title'],
             description=validated_data['description'],
-            endpoint=validated_data['endpoint'],
+            endpoint_id=validated_data['endpoint_id'],
             source=validated_data['source'],
-            customer=validated_data['customer']
+            customer_id=validated_data['customer_id']
         )
+
+    def create(self, validated_data):
+        rules = validated_data.pop('rules')
+        alert = self.build_alert(validated_data)
+        alert.save()
         alert.rules.set(rules)
         return alert
 
 class AlertMitigationSelectSerializer(serializers.ModelSerializer):
     class Meta:
         model = Alert
-        fields = "mitigation",
\ No newline at end of file
+        fields = "mitigation",
+
+
+class WindowParamsSerializer(serializers.Serializer):
+    """
+    Reporting window from the `after`/`before` query params, defaulting to the last seven days.
+    """
+    after = serializers.DateTimeField(required=False)
+    before = serializers.DateTimeField(required=False)
+
+    def validate(self, data):
+        current = now()
+        data.setdefault('before', current)
+        data.setdefault('after', current - timedelta(days=7))
+        return data
@@ -0,0 +1,92 @@
+from django.db.models.signals import post_init, post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+from django.utils.timezone import now
+
+from .caching import invalidate_dashboard_cache, invalidate_endpoint_caches
+from .models import Alert, Endpoint, Source, MitigationStrategy, Customer, Rule
+
+
+@receiver([post_save, post_delete], sender=Alert)
+def invalidate_alert_dashboard_cache(sender, instance, **kwargs):
+    """Drop the customer's cached dashboard statistics whenever one of their alerts changes."""
+    invalidate_dashboard_cache(instance.customer_id)
+
+
+@receiver([post_save, post_delete], sender=Endpoint)
+def invalidate_endpoint_cache(sender, instance, **kwargs):
+    """Drop the customer's cached endpoint statistics and report rows whenever one of their endpoints changes."""
+    invalidate_endpoint_caches(instance.customer_id)
+
+
+# The alert foreign key for each related model an alert renders, and the fields of it that are rendered
+ALERT_RELATIONS = {
+    Source: ('source', ('name', 'description')),
+    MitigationStrategy: ('mitigation_strategy', ('description',)),
+    Customer: ('customer', ('company_name',)),
+    Endpoint: ('endpoint', ('name',)),
+    Rule: ('rules', ('name',)),
+}
+
+
+def touch_alerts(**lookup):
+    """
+    Bump updated_at on the matching alerts. Their ETags and cached representations are keyed on it,
+    and unlike the per-process cache it is seen by every worker.
+    """
+    Alert.objects.filter(**lookup).update(updated_at=now())
+
+
+@receiver(post_init, sender=Source)
+@receiver(post_init, sender=MitigationStrategy)
+@receiver(post_init, sender=Customer)
+@receiver(post_init, sender=Endpoint)
+@receiver(post_init, sender=Rule)
+def remember_rendered_values(sender, instance, **kwargs):
+    """Keep the loaded values of the fields alerts render, deferred ones are left out rather than fetched."""
+    _, fields = ALERT_RELATIONS[sender]
+    instance._rendered_values = {field: instance.__dict__[field] for field in fields if field in instance.__dict__}
+
+
+@receiver(post_save, sender=Source)
+@receiver(post_save, sender=MitigationStrategy)
+@receiver(post_save, sender=Customer)
+@receiver(post_save, sender=Endpoint)
+@receiver(post_save, sender=Rule)
+def touch_alerts_on_related_save(sender, instance, created, raw, update_fields, **kwargs):
+    """
+    An edit to a rendered field of an alert's source, strategy, customer, endpoint or rule changes how the alert
+    renders. Saves that leave those fields as loaded, and fixture loads, touch nothing.
+    """
+    if created or raw:
+        return
+    relation, fields = ALERT_RELATIONS[sender]
+    if update_fields is not None:
+        fields = [field for field in fields if field in update_fields]
+    saved = {field: instance.__dict__[field] for field in fields if field in instance.__dict__}
+    loaded = instance._rendered_values
+    if any(field not in loaded or loaded[field] != value for field, value in saved.items()):
+        touch_alerts(**{relation: instance})
+    loaded.update(saved)
+
+
+@receiver(pre_delete, sender=MitigationStrategy)
+def touch_alerts_on_strategy_delete(sender, instance, **kwargs):
+    """SET_NULL clears the strategy with a plain UPDATE, so touch its alerts while they still point to it."""
+    touch_alerts(mitigation_strategy=instance)
+
+
+@receiver(pre_delete, sender=Rule)
+def touch_alerts_on_rule_delete(sender, instance, **kwargs):
+    """Alerts list their rules by name; deleting a rule drops its links without m2m_changed."""
+    touch_alerts(rules=instance)
+
+
+@receiver(m2m_changed, sender=Alert.rules.through)
+def touch_alerts_on_rules_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Rule links changed through rules.set()/add()/remove()/clear(), from either side."""
+    if not reverse and action in ('post_add', 'post_remove', 'post_clear'):
+        touch_alerts(pk=instance.pk)
+    elif reverse and action in ('post_add', 'post_remove'):
+        touch_alerts(pk__in=pk_set)
+    elif reverse and action == 'pre_clear':
+        touch_alerts(rules=instance)
@@ -1,3 +1,268 @@
-from django.test import TestCase
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, timedelta
+from pathlib import Path
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from trench.models import MFAMethod
+
+from .models import Customer, Endpoint, Source, Alert, UserProfile, Rule, MitigationStrategy
+from . import reports
+from .reports import render_report, render_report_in_worker
+
+
+class AlertViewerTestCase(APITestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = Customer.objects.create(company_name='Acme', industry='Retail', contact_email='soc@acme.test')
+        cls.endpoint = Endpoint.objects.create(customer=cls.customer, host='ws-01', ip='10.0.0.1', name='WS-01',
+                                               type='workstation')
+        cls.source = Source.objects.create(name='EDR', description='Endpoint detection')
+        for severity, status in [(Alert.Severity.HIGH, Alert.Status.OPEN), (Alert.Severity.LOW, Alert.Status.RESOLVED),
+                                 (Alert.Severity.LOW, Alert.Status.OPEN)]:
+            Alert.objects.create(title='Suspicious process', description='powershell -enc', endpoint=cls.endpoint,
+                                 source=cls.source, customer=cls.customer, severity=severity, status=status)
+
+        cls.user = User.objects.create_user('acme', password='secret')
+        UserProfile.objects.create(user=cls.user, customer=cls.customer)
+
+        cls.analyst = User.objects.create_user('analyst', password='secret')
+        UserProfile.objects.create(user=cls.analyst, is_analyst=True)
+        MFAMethod.objects.create(user=cls.analyst, name='app', secret='secret', is_primary=True, is_active=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.user)
+
+
+class PDFReportViewTests(AlertViewerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        report_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, report_dir)
+        self.report_dir = Path(report_dir)
+        settings_override = override_settings(REPORT_CACHE_DIR=self.report_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_report_is_rendered(self):
+        response = self.client.get('/pdf-report/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertTrue(b''.join(response.streaming_content).startswith(b'%PDF'))
+
+    def test_expired_reports_are_removed(self):
+        expired = self.report_dir / 'expired.pdf'
+        expired.write_bytes(b'%PDF')
+        os.utime(expired, (0, 0))
+
+        response = self.client.get('/pdf-report/')
+        response.close()
+
+        self.assertFalse(expired.exists())
+        self.assertEqual(len(list(self.report_dir.glob('*.pdf'))), 1)
+
+
+class RenderReportTests(SimpleTestCase):
+
+    @staticmethod
+    def month_report(before_date):
+        days = [before_date - timedelta(days=offset) for offset in range(29, -1, -1)]
+        return {
+            'company_name': 'Acme',
+            'after_date': days[0],
+            'before_date': before_date,
+            'severity_data': [('high', 1), ('low', 2), ('medium', 3)],
+            'event_data': [(day.isoformat(), 5) for day in days],
+            'status_data': [('open', 4), ('resolved', 2)],
+            'source_data': [('EDR', 6)],
+            'endpoint_rows': [('WS-01', True)],
+        }
+
+    def test_reports_with_shared_charts_render_in_one_process(self):
+        # Same severity, status and source charts, so their cached shapes are reused by the second document
+        for before_date in (date(2024, 12, 31), date(2024, 12, 30)):
+            output = io.BytesIO()
+            render_report(self.month_report(before_date), output)
+            self.assertTrue(output.getvalue().startswith(b'%PDF'))
+
+    def test_broken_render_pool_is_replaced(self):
+        broken_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+        with self.assertRaises(BrokenProcessPool):
+            broken_pool.submit(os._exit, 1).result()
+        reports._render_pool = broken_pool
+        report_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, report_dir)
+        report_path = Path(report_dir) / 'report.pdf'
+
+        render_report_in_worker(self.month_report(date(2024, 12, 31)), report_path)
+
+        self.assertTrue(report_path.read_bytes().startswith(b'%PDF'))
+        self.assertIsNot(reports._render_pool, broken_pool)
+
+
+class CustomerAlertDashboardViewTests(AlertViewerTestCase):
+
+    def test_stats_are_grouped(self):
+        response = self.client.get('/dashboard/Acme/alerts/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertCountEqual(response.data['severity_stats'], [{'severity': 'high', 'count': 1},
+                                                                {'severity': 'low', 'count': 2}])
+        self.assertCountEqual(response.data['status_stats'], [{'status': 'open', 'count': 2},
+                                                              {'status': 'resolved', 'count': 1}])
+        self.assertEqual(response.data['source_stats'], [{'source': 'EDR', 'count': 3}])
+        self.assertEqual(sum(day['count'] for day in response.data['event_counts']), 3)
+
+
+class ReceiveAlertViewTests(AlertViewerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.analyst)
+        Rule.objects.create(name='Encoded PowerShell', description='powershell -enc')
+        Rule.objects.create(name='Lateral movement', description='psexec')
+
+    def batch(self, *rules):
+        alert = {'description': 'powershell -enc', 'endpoint_id': self.endpoint.pk, 'source_name': 'EDR',
+                 'customer_id': self.customer.pk}
+        return [{**alert, 'title': f'Alert {i}', 'rules': alert_rules} for i, alert_rules in enumerate(rules)]
+
+    def test_batch_is_created_with_its_rules(self):
+        response = self.client.post('/receive/', self.batch(['Encoded PowerShell'],
+                                                            ['Encoded PowerShell', 'Lateral movement']), format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([item['title'] for item in response.data], ['Alert 0', 'Alert 1'])
+        self.assertCountEqual(response.data[1]['rules'], ['Encoded PowerShell', 'Lateral movement'])
+        created = Alert.objects.filter(pk__in=[item['id'] for item in response.data]).order_by('pk')
+        self.assertEqual([(alert.title, alert.source, alert.customer, sorted(alert.rules.values_list('name', flat=True)))
+                          for alert in created],
+                         [('Alert 0', self.source, self.customer, ['Encoded PowerShell']),
+                          ('Alert 1', self.source, self.customer, ['Encoded PowerShell', 'Lateral movement'])])
+
+    def test_batch_errors_are_reported_per_alert(self):
+        response = self.client.post('/receive/', self.batch(['Encoded PowerShell'], ['Unknown']), format='json')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, [{}, {'rules': ['One or more rules not found.']}])
+        self.assertEqual(Alert.objects.count(), 3)
+
+
+class AlertConditionalGetTests(AlertViewerTestCase):
+
+    def test_related_rename_changes_the_etag(self):
+        etag = self.client.get('/alerts/')['ETag']
+        self.assertEqual(self.client.get('/alerts/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.source.name = 'XDR'
+        self.source.save()
+
+        response = self.client.get('/alerts/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual({alert['source']['name'] for alert in response.data['results']}, {'XDR'})
+
+    def test_list_sends_only_the_etag(self):
+        response = self.client.get('/alerts/')
+
+        self.assertIn('ETag', response)
+        self.assertNotIn('Last-Modified', response)
+
+    def test_unrendered_edits_keep_the_etag(self):
+        etag = self.client.get('/alerts/')['ETag']
+
+        self.endpoint.is_active = False
+        self.endpoint.save()
+        self.endpoint.save()
+        self.customer.industry = 'Finance'
+        self.customer.save(update_fields=['industry'])
+
+        self.assertEqual(self.client.get('/alerts/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+
+class AlertDetailViewTests(AlertViewerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.analyst)
+        self.alert = Alert.objects.first()
+
+    def test_detail_sends_last_modified(self):
+        response = self.client.get(f'/alerts/all/{self.alert.pk}/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+    def test_strategy_is_linked(self):
+        response = self.client.post(f'/alerts/all/{self.alert.pk}/', {'description': 'Isolate the host'})
+
+        self.assertEqual(response.status_code, 201)
+        self.alert.refresh_from_db()
+        self.assertEqual(self.alert.mitigation_strategy.description, 'Isolate the host')
+
+    def test_closure_code_is_set(self):
+        response = self.client.patch(f'/alerts/all/{self.alert.pk}/', {'closure_code': 'TPNM'})
+
+        self.assertEqual(response.status_code, 200)
+        self.alert.refresh_from_db()
+        self.assertEqual((self.alert.closure_code, self.alert.status, self.alert.validator),
+                         ('TPNM', Alert.Status.VALIDATED, self.analyst))
+
+    def test_missing_alert_creates_no_strategy(self):
+        response = self.client.post('/alerts/all/0/', {'description': 'Isolate the host'})
+
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(MitigationStrategy.objects.exists())
+
+
+class AlertRepresentationCacheTests(AlertViewerTestCase):
+
+    def alert_rules(self, alert):
+        response = self.client.get('/alerts/')
+        return next(item['rules'] for item in response.data['results'] if item['id'] == alert.pk)
+
+    def test_rule_changes_are_not_served_stale(self):
+        alert = Alert.objects.first()
+        rule = Rule.objects.create(name='Encoded PowerShell', description='powershell -enc')
+        self.assertEqual(self.alert_rules(alert), [])
+
+        alert.rules.set([rule])
+        self.assertEqual(self.alert_rules(alert), ['Encoded PowerShell'])
+
+        rule.name = 'Obfuscated PowerShell'
+        rule.save()
+        self.assertEqual(self.alert_rules(alert), ['Obfuscated PowerShell'])
+
+
+class JWTAuthenticationTests(AlertViewerTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_bearer_token_authenticates_with_profile(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}')
+
+        response = self.client.get('/alerts/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.wsgi_request.user.profile.customer, self.customer)
+
+    def test_inactive_user_is_rejected(self):
+        token = AccessToken.for_user(self.user)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+
+        self.assertEqual(self.client.get('/alerts/').status_code, 401)
@@ -1,4 +1,5 @@
-from django.urls import path
+from django.urls import path, include
+from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 
 from alertviewer.views import ReceiveAlertView, AlertListView, NonMaliciousListView, AlertDetailView, \
     MitigationStrategyListView, NonMaliciousUpdateResolveView, CompanyEndpointsView, AnalystCompanyEndpointsView, \
@@ -11,7 +12,7 @@ metrix_urlpatterns = [
     path('<str:company_name>/endpoints/', CustomerEndpointDashboardView.as_view(),
          name='customer-endpoint-dashboard'),
     path('<str:company_name>/alerts/', CustomerAlertDashboardView.as_view(),
-         name='customer-endpoint-dashboard'),
+         name='customer-alert-dashboard'),
 ]
 alerts_urlpatterns = [
     path('all/', AlertListView.as_view(), name='alert-list'),
@@ -21,7 +22,7 @@ alerts_urlpatterns = [
          name='mitigation-strategy-list'),
     path('non-malicious/', NonMaliciousListView.as_view(), name='non-malicious-alert-list'),
     path('non-malicious/<int:pk>/', NonMaliciousUpdateResolveView.as_view(),
-         name='non-malicious-alert-list'),
+         name='non-malicious-alert-detail'),
 ]
 endpoints_urlpatterns = [
     path('', CompanyEndpointsView.as_view(), name='company-endpoints'),
@@ -33,3 +34,12 @@ endpoints_urlpatterns = [
 reporting_urlpatterns = [
     path("", PDFReportView.as_view(), name='pdf_report')
 ]
+doc_urlpatterns = [
+    path('', SpectacularAPIView.as_view(), name='schema'),
+    path('swagger/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
+    path('redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+]
+auth_urlpatterns = [
+    path('', include('trench.urls')),
+    path('', include('trench.urls.jwt')),
+]
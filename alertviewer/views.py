@@ -1,39 +1,150 @@
-from datetime import datetime
-from datetime import timedelta
-from io import BytesIO
-
-from django.db.models import Q, Count
-from django.db.models.functions import TruncDate
-from django.http import HttpResponse
+import hashlib
+import os
+import time
+from calendar import timegm
+from functools import cached_property
+from tempfile import mkstemp
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q, Count, Max, Value, CharField
+from django.db.models.functions import Cast
+from django.http import FileResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
 from django.utils.timezone import now
+from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, OpenApiParameter, extend_schema_view, OpenApiResponse, \
     inline_serializer
-from reportlab.graphics.charts.barcharts import VerticalBarChart
-from reportlab.graphics.charts.piecharts import Pie
-from reportlab.graphics.shapes import Drawing
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
 from rest_framework import status, serializers, permissions
 from rest_framework.exceptions import NotFound
-from rest_framework.fields import CharField
 from rest_framework.generics import RetrieveUpdateAPIView, ListAPIView, CreateAPIView
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .caching import dashboard_cache_key, invalidate_dashboard_cache, endpoint_dashboard_cache_key, \
+    endpoint_rows_cache_key, DASHBOARD_CACHE_TIMEOUT
 from .filters import AlertFilter
 from .models import Alert, Endpoint, Customer, MitigationStrategy
+from .pagination import AlertCursorPagination
 from .permissions import IsCustomer, IsAnalyst, is_analyst, IsAuthenticatedWithMFA
-from .serializers import AlertSerializer, MitigationStrategySerializer, EndpointSerializer, AlertCreateSerializer, \
-    AlertMitigationSelectSerializer, EndpointCustSerializer
+from .reports import render_report_in_worker
+from .serializers import AlertSerializer, AlertListSerializer, MitigationStrategySerializer, EndpointSerializer, \
+    AlertCreateSerializer, AlertMitigationSelectSerializer, EndpointCustSerializer, WindowParamsSerializer, \
+    eager_load
+
+
+VALID_CLOSURE_CODES = frozenset(Alert.ClosureCode.values)
+VALID_MITIGATIONS = frozenset(Alert.Mitigation.values)
+
+
+def update_alerts(alerts, **values):
+    """
+    UPDATE the alerts with the values and return the number of rows written.
+    QuerySet.update() skips auto_now, so updated_at, which keys the alerts' ETags and cached representations,
+    is set here unless given.
+    """
+    values.setdefault('updated_at', now())
+    return alerts.update(**values)
+
+
+def count_alerts_by(alerts, *fields):
+    """
+    Count the alerts per value of each field, all fields in a single UNION ALL round trip.
+    Returns {field: [(value as text, count), ...]} ordered by value; values without alerts are left out.
+    """
+    groupings = [
+        alerts.annotate(grouping=Value(field), label=Cast(field, CharField()))
+        .values_list('grouping', 'label')
+        .annotate(count=Count('id'))
+        .order_by()
+        for field in fields
+    ]
+    counts = {field: [] for field in fields}
+    for grouping, label, count in groupings[0].union(*groupings[1:], all=True).order_by('grouping', 'label'):
+        counts[grouping].append((label, count))
+    return counts
+
+
+class EagerLoadingMixin:
+    """
+    Eager-load the relations the view's serializer is going to render, derived from its fields.
+    New nested fields get their joins automatically, and `?fields=` requests skip the ones they prune.
+    """
+
+    def get_queryset(self):
+        return eager_load(super().get_queryset(), self.get_serializer())
+
+
+class AlertConditionalGetMixin:
+    """
+    Answer GET with 304 Not Modified while the alerts behind the response are unchanged.
+    The ETag covers the full path, so every filter, page and field selection gets its own validator.
+    Edits to the related rows an alert renders bump its updated_at (see signals.touch_alerts), and the
+    aggregate is answered from the updated_at indexes.
+    Last-Modified is only sent where it is exact: MAX(updated_at) of a list does not move when an alert is
+    deleted or leaves the filter, so list validators rely on the ETag, which also covers the count.
+    """
+    send_last_modified = False
+
+    def get_conditional_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    def get(self, request, *args, **kwargs):
+        state = self.get_conditional_queryset().aggregate(last_modified=Max('updated_at'), count=Count('id'))
+        etag = quote_etag(hashlib.md5(
+            f"{request.get_full_path()}:{state['count']}:{state['last_modified']}".encode(),
+            usedforsecurity=False,
+        ).hexdigest())
+        last_modified = (self.send_last_modified and state['last_modified']
+                         and timegm(state['last_modified'].utctimetuple()))
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is not None:
+            return response
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response['ETag'] = etag
+            if last_modified:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class CustomerScopedMixin:
+    """
+    Resolve the customer a request is scoped to once, however many times the view asks for it.
+    """
+
+    @cached_property
+    def customer(self):
+        return self.get_customer()
+
+    def get_customer(self):
+        return self.request.user.profile.customer
+
+
+class AnalystCustomerScopedMixin(CustomerScopedMixin):
+    """
+    Analysts pick the customer through the `company_name` URL kwarg, customers are scoped to their own.
+    """
+
+    def get_customer(self):
+        if is_analyst(self.request):
+            try:
+                return Customer.objects.get(company_name=self.kwargs.get('company_name'))
+            except Customer.DoesNotExist:
+                raise NotFound(detail="Customer not found.")
+        return super().get_customer()
 
 
 @extend_schema(
     request=AlertCreateSerializer,
     responses={201: AlertSerializer},
-    description="Create a new alert and return its details."
+    description="Create a new alert and return its details. "
+                "A list of alerts is created in bulk and returned as a list."
 )
 class ReceiveAlertView(CreateAPIView):
     """Receiving object, creating of the new Alert if data is valid"""
@@ -42,12 +153,20 @@ class ReceiveAlertView(CreateAPIView):
     permission_classes = [IsAuthenticatedWithMFA]
 
     def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
+        many = isinstance(request.data, list)
+        serializer = self.get_serializer(data=request.data, many=many)
         serializer.is_valid(raise_exception=True)
-        alert = serializer.save()
-        response_serializer = AlertSerializer(alert)
+        created = serializer.save()
+        alerts = self.get_created_queryset([alert.pk for alert in created] if many else [created.pk])
+        response_serializer = AlertSerializer(alerts if many else alerts.get(), many=many)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    def get_created_queryset(self, pks):
+        """
+        Re-read the created alerts with everything AlertSerializer renders joined in.
+        """
+        return eager_load(Alert.objects.filter(pk__in=pks), AlertSerializer()).order_by('pk')
+
 
 @extend_schema(
     parameters=[
@@ -81,41 +200,33 @@ class ReceiveAlertView(CreateAPIView):
             required=False,
             type=OpenApiTypes.DATETIME,
         ),
+        OpenApiParameter(
+            name="fields",
+            description="Comma-separated list of fields to return, e.g. 'id,title,status,timestamp'.",
+            required=False,
+            type=OpenApiTypes.STR,
+        ),
     ],
     description="Retrieve a paginated list of alerts with optional filtering.",
-    responses={200: AlertSerializer(many=True)},
+    responses={200: AlertListSerializer(many=True)},
 )
-class AlertListView(ListAPIView):
+class AlertListView(AlertConditionalGetMixin, EagerLoadingMixin, ListAPIView):
     """Alert List representation for Analysts"""
 
     permission_classes = (IsAuthenticatedWithMFA, IsAnalyst)
-    queryset = Alert.objects.all()
-    serializer_class = AlertSerializer
+    queryset = Alert.objects.defer('description')
+    serializer_class = AlertListSerializer
+    pagination_class = AlertCursorPagination
+    filter_backends = [DjangoFilterBackend]
     filterset_class = AlertFilter
 
-    def get_queryset(self):
-        queryset = super().get_queryset()
-        return self.filter_queryset_by_timestamp(queryset)
-
-    def filter_queryset_by_timestamp(self, queryset):
-        before = self.request.query_params.get('timestamp_before')
-        after = self.request.query_params.get('timestamp_after')
 
-        if before:
-            queryset = queryset.filter(timestamp__lte=before)
-
-        if after:
-            queryset = queryset.filter(timestamp__gte=after)
-        return queryset
-
-
-class CustomerAlertListView(AlertListView):
+class CustomerAlertListView(CustomerScopedMixin, AlertListView):
     """List representation of Alerts for Customer."""
     permission_classes = (permissions.IsAuthenticated, IsCustomer)
 
     def get_queryset(self):
-        queryset = Alert.objects.filter(customer=self.request.user.profile.customer)
-        return self.filter_queryset_by_timestamp(queryset)
+        return super().get_queryset().filter(customer=self.customer)
 
 
 
@@ -128,7 +239,7 @@ class CustomerAlertListView(AlertListView):
     patch=extend_schema(
         description="Update the closure_code of an alert. Must provide a valid closure_code.",
         request=inline_serializer(
-            name="AlertClosureCodeSerializer", fields={"closure_code": CharField()},
+            name="AlertClosureCodeSerializer", fields={"closure_code": serializers.CharField()},
         ),
         responses={
             200: OpenApiResponse(description="Closure code updated successfully."),
@@ -144,36 +255,38 @@ class CustomerAlertListView(AlertListView):
         },
     ),
 )
-class AlertDetailView(RetrieveUpdateAPIView):
+class AlertDetailView(AlertConditionalGetMixin, EagerLoadingMixin, RetrieveUpdateAPIView):
     """Analysis of the details of the alert object. Patch for setting closure_code and Post for assigning mitigation_strategy."""
     queryset = Alert.objects.all()
     serializer_class = AlertSerializer
     permission_classes = (IsAuthenticatedWithMFA, IsAnalyst)
     lookup_field = 'pk'
     allowed_methods = ['GET', 'PATCH', 'POST']
+    send_last_modified = True
+
+    def get_conditional_queryset(self):
+        return self.get_queryset().filter(pk=self.kwargs['pk'])
 
     def post(self, request, *args, **kwargs):
         """
         Create MitigationStrategy and attach it to the alert.
         """
-        alert = self.get_object()
-
         mitigation_data = request.data.get('description')
-        if not mitigation_data:
+        if not isinstance(mitigation_data, str) or not mitigation_data.strip():
             return Response({'detail': 'Mitigation strategy description is required.'},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        mitigation_serializer = MitigationStrategySerializer(data={"description":mitigation_data})
-        pre_existing_strategy = MitigationStrategy.objects.filter(description=mitigation_data).first()
-        if not mitigation_serializer.is_valid():
-            return Response(mitigation_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-        elif not pre_existing_strategy:
-            mitigation_strategy = mitigation_serializer.save()
-            alert.mitigation_strategy = mitigation_strategy
-        elif pre_existing_strategy:
-
-            alert.mitigation_strategy = pre_existing_strategy
-        alert.save()
+        # One transaction, so a missing alert also rolls back the strategy created for it
+        with transaction.atomic():
+            # get_or_create retries the lookup if a concurrent request inserts the same description first
+            mitigation_strategy, _ = MitigationStrategy.objects.get_or_create(description=mitigation_data)
+
+            # Only write when the strategy actually changes
+            alerts = Alert.objects.filter(pk=self.kwargs['pk'])
+            updated = update_alerts(alerts.exclude(mitigation_strategy=mitigation_strategy),
+                                    mitigation_strategy=mitigation_strategy)
+            if not updated and not alerts.exists():
+                raise NotFound()
         return Response({'detail': 'Mitigation strategy created and linked to alert.'},
                         status=status.HTTP_201_CREATED)
 
@@ -183,15 +296,27 @@ class AlertDetailView(RetrieveUpdateAPIView):
         Update closure_code for alert.
         """
         closure_code = request.data.get('closure_code')
-        if closure_code not in dict(Alert.CLOSURE_CODE_CHOICES).keys():
+        if not isinstance(closure_code, str) or closure_code not in VALID_CLOSURE_CODES:
             return Response({'detail': 'Invalid closure code.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        alert = self.get_object()
-        alert.closure_code = closure_code
-        alert.status = 'validated'
-        alert.validator = request.user
-        alert.validated_at = now()
-        alert.save()
+        # Written with an UPDATE, no need to load the alert first. update() sends no post_save,
+        # so the dashboard cache is invalidated by hand.
+        alerts = Alert.objects.filter(pk=self.kwargs['pk'])
+        validated_at = now()
+        updated = update_alerts(
+            alerts,
+            closure_code=closure_code,
+            status=Alert.Status.VALIDATED,
+            validator=request.user,
+            validated_at=validated_at,
+            updated_at=validated_at,
+        )
+        if not updated:
+            raise NotFound()
+        # None if the alert was deleted since the UPDATE, its delete signal already dropped the cache
+        customer_id = alerts.values_list('customer_id', flat=True).first()
+        if customer_id is not None:
+            invalidate_dashboard_cache(customer_id)
 
         return Response({'detail': 'Closure code updated successfully.'}, status=status.HTTP_200_OK)
 
@@ -203,18 +328,20 @@ class MitigationStrategyListView(ListAPIView):
     permission_classes = (IsAuthenticatedWithMFA, IsAnalyst)
 
 
-class NonMaliciousListView(ListAPIView):
+class NonMaliciousListView(CustomerScopedMixin, AlertConditionalGetMixin, EagerLoadingMixin, ListAPIView):
     """List of non-malicious Alerts that customer can remediate by himself"""
-    queryset = Alert.objects.filter(closure_code='TPNM')
-    serializer_class = AlertSerializer
+    queryset = Alert.objects.defer('description')
+    serializer_class = AlertListSerializer
     permission_classes = [permissions.IsAuthenticated, IsCustomer]
 
     def get_queryset(self):
         """
-        Filter by the alert of a specific customer.
+        Filter by the alert of a specific customer, in the one clause the partial TPNM index covers.
         """
-        customer = self.request.user.profile.customer  # Assuming user has a related customer.
-        return self.queryset.filter(customer=customer)
+        return super().get_queryset().filter(
+            closure_code=Alert.ClosureCode.TPNM,
+            customer=self.customer,
+        )
 
 
 @extend_schema_view(
@@ -238,18 +365,18 @@ class NonMaliciousListView(ListAPIView):
         },
     ),
 )
-class NonMaliciousUpdateResolveView(RetrieveUpdateAPIView):
+class NonMaliciousUpdateResolveView(CustomerScopedMixin, EagerLoadingMixin, RetrieveUpdateAPIView):
     """
     View to handle non-malicious alerts. Customers can mark alerts as mitigated or resolved.
     """
+    queryset = Alert.objects.filter(closure_code=Alert.ClosureCode.TPNM)
     permission_classes = [permissions.IsAuthenticated, IsCustomer]
 
     def get_queryset(self):
         """
         Filter by the alert of a specific customer.
         """
-        customer = self.request.user.profile.customer
-        return Alert.objects.filter(Q(customer=customer) & Q(closure_code='TPNM'))
+        return super().get_queryset().filter(customer=self.customer)
 
     def get_serializer_class(self):
         """
@@ -264,16 +391,18 @@ class NonMaliciousUpdateResolveView(RetrieveUpdateAPIView):
         Endpoint to mark an alert as mitigated.
         This allows the customer to select a mitigation strategy.
         """
-        alert = self.get_object()
         mitigation = request.data.get('mitigation')
 
-        if mitigation and mitigation not in dict(Alert.MITIGATION_CHOICES):
+        if not isinstance(mitigation, str) or mitigation not in VALID_MITIGATIONS:
             return Response({"detail": "Invalid mitigation strategy."}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Update the alert with the mitigation strategy and resolve the alert
-        alert.mitigation = mitigation
-        alert.save()
+        # A single UPDATE scoped like get_queryset()
+        alerts = Alert.objects.filter(pk=self.kwargs['pk'], closure_code=Alert.ClosureCode.TPNM,
+                                      customer=self.customer)
+        if not update_alerts(alerts, mitigation=mitigation):
+            raise NotFound()
 
+        alert = eager_load(alerts, AlertSerializer()).get()
         return Response(AlertSerializer(alert).data, status=status.HTTP_200_OK)
 
     def put(self, request, *args, **kwargs):
@@ -281,7 +410,7 @@ class NonMaliciousUpdateResolveView(RetrieveUpdateAPIView):
         Customer can mark alert as resolved.
         """
         alert = self.get_object()
-        alert.status = 'resolved'
+        alert.status = Alert.Status.RESOLVED
         alert.resolver = request.user
         alert.resolved_at = now()
         alert.save()
@@ -289,13 +418,12 @@ class NonMaliciousUpdateResolveView(RetrieveUpdateAPIView):
         return Response({'detail': 'Alert marked as resolved.'}, status=status.HTTP_200_OK)
 
 
-class CompanyEndpointsView(ListAPIView):
+class CompanyEndpointsView(CustomerScopedMixin, ListAPIView):
     permission_classes = [permissions.IsAuthenticated, IsCustomer]
     serializer_class = EndpointCustSerializer
 
     def get_queryset(self):
-        customer = self.request.user.profile.customer
-        return Endpoint.objects.filter(customer=customer)
+        return Endpoint.objects.filter(customer=self.customer)
 
 
 class AnalystCompanyEndpointsView(ListAPIView):
@@ -349,31 +477,30 @@ class EndpointDetailView(RetrieveUpdateAPIView):
         }
     )
 )
-class CustomerEndpointDashboardView(APIView):
+class CustomerEndpointDashboardView(AnalystCustomerScopedMixin, APIView):
     serializer_class = EndpointSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        if is_analyst(self.request):
-            company_name = self.kwargs['company_name']
-            try:
-                customer = Customer.objects.get(company_name=company_name)
-            except Customer.DoesNotExist:
-                raise NotFound(detail="Customer not found.")
-        else:
-            customer = self.request.user.profile.customer
-
-        return Endpoint.objects.filter(customer=customer)
+        return Endpoint.objects.filter(customer=self.customer)
 
     def get(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        active_count = queryset.filter(is_active=True).count()
-        inactive_count = queryset.filter(is_active=False).count()
+        # Dropped when one of the customer's endpoints is saved or deleted. The cache is per process and the
+        # signal only reaches the writing one, so the timeout bounds how stale the other workers can get.
+        stats = cache.get_or_set(
+            endpoint_dashboard_cache_key(self.customer.pk if self.customer else None),
+            lambda: self.get_queryset().aggregate(
+                total=Count('id'),
+                active=Count('id', filter=Q(is_active=True)),
+                inactive=Count('id', filter=Q(is_active=False)),
+            ),
+            DASHBOARD_CACHE_TIMEOUT,
+        )
 
         response_data = {
-            'total_endpoints': queryset.count(),
-            'active_endpoints': active_count,
-            'inactive_endpoints': inactive_count
+            'total_endpoints': stats['total'],
+            'active_endpoints': stats['active'],
+            'inactive_endpoints': stats['inactive']
         }
         return Response(response_data)
 
@@ -462,19 +589,10 @@ class CustomerEndpointDashboardView(APIView):
         }
     )
 )
-class CustomerAlertDashboardView(APIView):
+class CustomerAlertDashboardView(AnalystCustomerScopedMixin, APIView):
     permission_classes = [permissions.IsAuthenticated]
 
-    def get_queryset(self, after, before):
-        if is_analyst(self.request):
-            company_name = self.kwargs['company_name']
-            try:
-                customer = Customer.objects.get(company_name=company_name)
-            except Customer.DoesNotExist:
-                raise NotFound(detail="Customer not found.")
-        else:
-            customer = self.request.user.profile.customer
-
+    def get_queryset(self, customer, after, before):
         alerts = Alert.objects.filter(
             customer=customer,
             timestamp__gte=after,
@@ -483,64 +601,36 @@ class CustomerAlertDashboardView(APIView):
         return alerts
 
     def get(self, request, *args, **kwargs):
-        after = request.query_params.get('after', (now() - timedelta(days=7)).isoformat())
-        before = request.query_params.get('before', now().isoformat())
-
-        # Convert 'after' and 'before' to datetime
-        try:
-            after = datetime.fromisoformat(after)
-            before = datetime.fromisoformat(before)
-        except ValueError:
-            return Response({"detail": "Invalid datetime format."}, status=400)
-
-        # Get the queryset for alerts in the given time range
-        alerts = self.get_queryset(after, before)
-
-        # Severity statistics
-        severity_stats = (
-            alerts.values('severity')
-            .annotate(count=Count('severity'))
-            .order_by('severity')
+        params = WindowParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        after, before = params.validated_data['after'], params.validated_data['before']
+
+        customer = self.customer
+        # The default window moves with now(), so it is cached under the empty parameters
+        cache_key = dashboard_cache_key(
+            customer.pk if customer else None,
+            request.query_params.get('after', ''),
+            request.query_params.get('before', ''),
         )
-
-        # Event counts by day
-        event_counts = (
-            alerts.annotate(day=TruncDate('timestamp'))
-            .values('day')
-            .annotate(count=Count('id'))
-            .order_by('day')
-        )
-
-        # Source statistics
-        source_stats = (
-            alerts.values('source__name')
-            .annotate(count=Count('source'))
-            .order_by('source__name')
+        response_data = cache.get_or_set(
+            cache_key,
+            lambda: self.get_stats(self.get_queryset(customer, after, before)),
+            DASHBOARD_CACHE_TIMEOUT,
         )
+        return Response(response_data)
 
-        # Status statistics
-        status_stats = (
-            alerts.values('status')
-            .annotate(count=Count('status'))
-            .order_by('status')
-        )
+    @staticmethod
+    def get_stats(alerts):
+        counts = count_alerts_by(alerts, 'severity', 'status', 'source__name', 'timestamp_day')
 
         # Prepare data for charts.js
-        severity_data = [{'severity': item['severity'], 'count': item['count']} for item in severity_stats]
-        event_data = [{'date': item['day'].strftime('%Y-%m-%d'), 'count': item['count']} for item in event_counts]
-        source_data = [{'source': item['source__name'], 'count': item['count']} for item in source_stats]
-        status_data = [{'status': item['status'], 'count': item['count']} for item in status_stats]
-
-        # Prepare final response
-        response_data = {
-            'severity_stats': severity_data,
-            'event_counts': event_data,
-            'source_stats': source_data,
-            'status_stats': status_data
+        return {
+            'severity_stats': [{'severity': value, 'count': count} for value, count in counts['severity']],
+            'event_counts': [{'date': value, 'count': count} for value, count in counts['timestamp_day']],
+            'source_stats': [{'source': value, 'count': count} for value, count in counts['source__name']],
+            'status_stats': [{'status': value, 'count': count} for value, count in counts['status']],
         }
 
-        return Response(response_data)
-
 
 @extend_schema(
     summary="Generate PDF Report",
@@ -587,196 +677,84 @@ class CustomerAlertDashboardView(APIView):
         ),
     },
 )
-class PDFReportView(APIView):
+class PDFReportView(AnalystCustomerScopedMixin, APIView):
     def get(self, request, *args, **kwargs):
-        if is_analyst(request)  :
-            company_name = kwargs.get('company_name')
-            try:
-                customer = Customer.objects.get(company_name=company_name)
-            except Customer.DoesNotExist:
-                raise NotFound(detail="Customer not found.")
-        else:
-            customer = request.user.profile.customer
-            company_name = customer.company_name
+        customer = self.customer
+        company_name = customer.company_name
+
+        params = WindowParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        after_date, before_date = params.validated_data['after'], params.validated_data['before']
+
+        # Rendered reports are kept on disk under a hash of everything they show, so an identical
+        # report is served straight from the file (sendfile where the server supports it)
+        report = self.get_report_data(customer, after_date, before_date)
+        report_hash = hashlib.md5(repr(report).encode(), usedforsecurity=False).hexdigest()
+        report_path = settings.REPORT_CACHE_DIR / f'{report_hash}.pdf'
+        try:
+            report_file = open(report_path, 'rb')
+        except FileNotFoundError:
+            self.render_to_file(report, report_path)
+            self.prune_report_cache(report_path.parent)
+            report_file = open(report_path, 'rb')
 
-        after = request.query_params.get('after', (now() - timedelta(days=7)).isoformat())
-        before = request.query_params.get('before', now().isoformat())
+        return FileResponse(report_file, as_attachment=True, content_type='application/pdf',
+                            filename=f'{company_name}_report_'
+                                     f'{after_date.date().isoformat().replace("-", "")}-'
+                                     f'{before_date.date().isoformat().replace("-", "")}.pdf')
 
-        # Convert timestamps to datetime objects
+    @staticmethod
+    def render_to_file(report, report_path):
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        # Rendered next to the target and moved into place, so a concurrent request never reads a partial file
+        fd, tmp_path = mkstemp(dir=report_path.parent, suffix='.tmp')
+        os.close(fd)
         try:
-            after_date = datetime.fromisoformat(after)
-            before_date = datetime.fromisoformat(before)
-        except ValueError:
-            return Response({"error": "Invalid date format. Use ISO 8601 format (e.g., 2024-12-01T00:00:00)."},
-                            status=400)
+            render_report_in_worker(report, tmp_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        os.replace(tmp_path, report_path)
 
+    @staticmethod
+    def prune_report_cache(report_dir):
+        """
+        Remove rendered reports (and temp files left by interrupted renders) older than REPORT_CACHE_MAX_AGE.
+        Any change to the data in a window makes a new file, so without this the directory only grows.
+        """
+        expires = time.time() - settings.REPORT_CACHE_MAX_AGE
+        for entry in os.scandir(report_dir):
+            try:
+                if entry.is_file() and entry.stat().st_mtime < expires:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                # Pruned by a concurrent request
+                pass
+
+    @staticmethod
+    def get_report_data(customer, after_date, before_date):
+        """
+        Query everything the report shows and return it as plain data for render_report().
+        """
         # Fetch data for alerts and endpoints
         alerts = Alert.objects.filter(customer=customer, timestamp__gte=after_date, timestamp__lte=before_date)
         endpoints = Endpoint.objects.filter(customer=customer)
 
-        table_style = TableStyle([('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                                  ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                                  ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                                  ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                                  ('BOTTOMPADDING', (0, 0), (-1, 0), 12)])
-
-        # Prepare data for the report (same as in CustomerAlertDashboardView)
-        severity_stats = alerts.values('severity').annotate(count=Count('id'))
-        status_stats = alerts.values('status').annotate(count=Count('id'))
-        sources = alerts.values('source__name').annotate(count=Count('id'))
-
-        # Event counts by day
-        event_counts = (
-            alerts.annotate(day=TruncDate('timestamp'))
-            .values('day')
-            .annotate(count=Count('id'))
-            .order_by('day')
-        )
-
-        # Prepare data for charts.js (this can be adapted to reportlab charts)
-        event_data = [{'date': item['day'].strftime('%Y-%m-%d'), 'count': item['count']} for item in event_counts]
-        severity_data = [{'severity': item['severity'], 'count': item['count']} for item in severity_stats]
-        status_data = [{'status': item['status'], 'count': item['count']} for item in status_stats]
-        source_data = [{'source': item['source__name'], 'count': item['count']} for item in sources]
-        severity_order_fixer = severity_data.pop(1)
-        severity_data.append(severity_order_fixer)
-
-        # Generate PDF
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, onFirstPage=self.add_page_number,
-                                onLaterPages=self.add_page_number)
-        elements = []
-        styles = getSampleStyleSheet()
-
-        # Title
-        elements.append(Paragraph(f"Report for {customer.company_name}", styles['Title']))
-        elements.append(Spacer(1, 12))
-        elements.append(Paragraph(f"Data provided in this document is gathered "
-                                  f"between {after_date.strftime("%Y-%m-%d")} and "
-                                  f"{before_date.strftime("%Y-%m-%d")}",
-                                  styles['Normal']))
-
-        # --- Block 1: Alerts Summary (Table and Chart) ---
-        elements.append(Paragraph("Alerts Summary", styles['Heading2']))
-        alerts_table_data = [["Severity", "Count"]] + [[stat['severity'], stat['count']] for stat in severity_stats]
-        alerts_table = Table(alerts_table_data, hAlign='LEFT')
-        alerts_table.setStyle(table_style)
-        elements.append(alerts_table)
-        elements.append(Spacer(1, 12))
-
-        # Severity Bar Chart
-        drawing = Drawing(370, 180)
-        chart = VerticalBarChart()
-        chart.x = 50
-        chart.y = 50
-        chart.width = 300
-        chart.height = 125
-        chart.data = [[item['count'] for item in severity_data]]
-        chart.categoryAxis.categoryNames = [item['severity'] for item in severity_data]
-        chart.valueAxis.valueMin = 0
-        counter = 0
-        color_palette = [colors.coral, colors.yellow, colors.aquamarine]
-        max_val = len(chart.bars)
-        for i in range(0, max_val):
-            chart.bars[i].fillColor = color_palette[counter % 7]
-            counter += 1
-        drawing.add(chart)
-        elements.append(drawing)
-        elements.append(Spacer(1, 24))
-
-        # --- Block 2: Event Counts (Table and Chart) ---
-        elements.append(Paragraph("Event Counts by Date", styles['Heading2']))
-        event_table_data = [["Date", "Event Count"]] + [[item['date'], item['count']] for item in event_data]
-        event_table = Table(event_table_data, hAlign='LEFT')
-        event_table.setStyle(table_style)
-        elements.append(event_table)
-        elements.append(Spacer(1, 12))
-
-        # Event Counts Line Chart
-        drawing = Drawing(370, 180)
-        chart = VerticalBarChart()
-        chart.x = 50
-        chart.y = 50
-        chart.width = 300
-        chart.height = 125
-        chart.data = [[item['count'] for item in event_data]]
-        chart.categoryAxis.categoryNames = [item['date'] for item in event_data]
-        counter = 0
-        color_palette = [colors.cyan, colors.aliceblue, colors.aqua, colors.aquamarine, colors.azure, colors.beige]
-        max_val = len(chart.bars)
-        for i in range(0, max_val):
-            chart.bars[i].fillColor = color_palette[counter % 7]
-            counter += 1
-        drawing.add(chart)
-        elements.append(drawing)
-        elements.append(Spacer(1, 24))
-
-        # --- Block 3: Alert Status (Table and Chart) ---
-        elements.append(Paragraph("Alert Status Distribution", styles['Heading2']))
-        status_table_data = [["Status", "Count"]] + [[item['status'], item['count']] for item in status_data]
-        status_table = Table(status_table_data, hAlign='LEFT')
-        status_table.setStyle(table_style)
-        elements.append(status_table)
-        elements.append(Spacer(1, 12))
-
-        # Alert Status Pie Chart
-        drawing = Drawing(370, 180)
-        pie = Pie()
-        pie.x = 50
-        pie.y = 50
-        pie.width = 180
-        pie.height = 120
-        pie.data = [item['count'] for item in status_data]
-        pie.labels = [item['status'] for item in status_data]
-        pie.slices[0].fillColor = colors.red
-        pie.slices[1].fillColor = colors.yellow
-        pie.slices[2].fillColor = colors.blue
-        drawing.add(pie)
-        elements.append(drawing)
-        elements.append(Spacer(1, 24))
-
-        # --- Block 4: Sources (Table and Chart) ---
-        elements.append(Paragraph("Alert Sources", styles['Heading2']))
-        sources_table_data = [["Source", "Count"]] + [[item['source__name'], item['count']] for item in sources]
-        sources_table = Table(sources_table_data, hAlign='LEFT')
-        sources_table.setStyle(table_style)
-        elements.append(sources_table)
-        elements.append(Spacer(1, 12))
-
-        # Sources Bar Chart
-        drawing = Drawing(370, 180)
-        chart = VerticalBarChart()
-        chart.x = 50
-        chart.y = 50
-        chart.width = 300
-        chart.height = 125
-        chart.data = [[item['count'] for item in source_data]]
-        chart.categoryAxis.categoryNames = [item['source'] for item in source_data]
-        chart.bars[0].fillColor = colors.limegreen
-        drawing.add(chart)
-        elements.append(drawing)
-        elements.append(PageBreak())
-
-        # --- Block 5: Endpoint Status Table ---
-        elements.append(Paragraph("Endpoint Status", styles['Heading2']))
-        endpoint_status_data = [["Endpoint", "Is Active"]] + [[endpoint.name, endpoint.is_active] for endpoint in
-                                                              endpoints]
-        endpoint_status_table = Table(endpoint_status_data, hAlign='LEFT')
-        endpoint_status_table.setStyle(table_style)
-        elements.append(endpoint_status_table)
-
-        # Generate PDF
-        doc.build(elements)
-        buffer.seek(0)
-
-        response = HttpResponse(buffer, content_type='application/pdf')
-        response['Content-Disposition'] = (f'attachment; filename="{company_name}_report_'
-                                           f'{after_date.strftime("%Y%m%d")}-{before_date.strftime("%Y%m%d")}.pdf"')
-        return response
-
-    @staticmethod
-    def add_page_number(canvas, doc):
-        page_number = f"Page {doc.page}"
-        canvas.setFont('Helvetica', 10)
-        canvas.setFillColor(colors.black)
-        canvas.drawString(500, 20, page_number)
+        report_stats = count_alerts_by(alerts, 'severity', 'status', 'source__name', 'timestamp_day')
+
+        return {
+            'company_name': customer.company_name,
+            # The report only prints the days, and dates keep the data hash stable within a day
+            'after_date': after_date.date(),
+            'before_date': before_date.date(),
+            'severity_data': report_stats['severity'],
+            'event_data': report_stats['timestamp_day'],
+            'status_data': report_stats['status'],
+            'source_data': report_stats['source__name'],
+            # Plain tuples streamed in chunks, cached like the endpoint dashboard statistics
+            'endpoint_rows': cache.get_or_set(
+                endpoint_rows_cache_key(customer.pk),
+                lambda: list(endpoints.values_list('name', 'is_active').iterator(chunk_size=2000)),
+                DASHBOARD_CACHE_TIMEOUT,
+            ),
+        }
@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework_simplejwt',
+    'django_filters',
     'trench',
     'drf_spectacular',
 
@@ -125,6 +126,11 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Rendered PDF reports, reused while the data they show is unchanged (not served as media)
+REPORT_CACHE_DIR = BASE_DIR / 'report_cache'
+# Seconds a rendered report is kept; older files are removed whenever a new report is rendered
+REPORT_CACHE_MAX_AGE = 24 * 60 * 60
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
@@ -139,7 +145,7 @@ SPECTACULAR_SETTINGS = {
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'alertviewer.authentication.JWTAuthentication',
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
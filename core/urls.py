@@ -16,28 +16,26 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, SpectacularRedocView
 
 from alertviewer.urls import (
     receive_urlpatterns,
     metrix_urlpatterns,
     alerts_urlpatterns,
     endpoints_urlpatterns,
-    reporting_urlpatterns
+    reporting_urlpatterns,
+    doc_urlpatterns,
+    auth_urlpatterns,
 )
 
 
+# Busiest prefixes first, the resolver tries them in order
 urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('auth/', include('trench.urls')),
-    path('auth/', include('trench.urls.jwt')),
-    path('doc/', SpectacularAPIView.as_view(), name='schema'),
-    path('doc/swagger/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
-    path('doc/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
     path('receive/', include(receive_urlpatterns), name='receive'),
-    path('dashboard/', include(metrix_urlpatterns), name='dashboard'),
     path('alerts/', include(alerts_urlpatterns), name='alerts'),
+    path('dashboard/', include(metrix_urlpatterns), name='dashboard'),
     path('endpoints/', include(endpoints_urlpatterns), name='endpoints'),
     path('pdf-report/', include(reporting_urlpatterns), name='reporting'),
+    path('auth/', include(auth_urlpatterns)),
+    path('doc/', include(doc_urlpatterns)),
+    path('admin/', admin.site.urls),
 ]
-